@@ -34,6 +34,8 @@ from pulpcore.app.util import get_domain_pk, cache_key, get_url
 
 _logger = logging.getLogger(__name__)
 
+artifact_uuid_regex = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+
 
 class PublicationQuerySet(models.QuerySet):
     """A queryset that provides publication filtering methods."""
@@ -746,7 +748,7 @@ class ArtifactDistribution(Distribution):
     def content_handler(self, path):
         """Serve an artifact or return 404."""
         uuid = path.rstrip("/")
-        if re.match(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}", uuid):
+        if artifact_uuid_regex.match(uuid):
             artifact = Artifact.objects.filter(pk=uuid).select_related("pulp_domain").first()
             if artifact:
                 return ArtifactResponse(artifact)